@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/ai_lib.dir/src/ai_core.cpp.o"
+  "CMakeFiles/ai_lib.dir/src/ai_core.cpp.o.d"
+  "libai_lib.pdb"
+  "libai_lib.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/ai_lib.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,20 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/ai_engine/src/ai_core.cpp" "CMakeFiles/run_ai_test.dir/src/ai_core.cpp.o" "gcc" "CMakeFiles/run_ai_test.dir/src/ai_core.cpp.o.d"
+  "/root/package/ai_engine/src/main.cpp" "CMakeFiles/run_ai_test.dir/src/main.cpp.o" "gcc" "CMakeFiles/run_ai_test.dir/src/main.cpp.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
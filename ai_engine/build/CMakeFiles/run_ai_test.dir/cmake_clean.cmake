@@ -0,0 +1,13 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/run_ai_test.dir/src/ai_core.cpp.o"
+  "CMakeFiles/run_ai_test.dir/src/ai_core.cpp.o.d"
+  "CMakeFiles/run_ai_test.dir/src/main.cpp.o"
+  "CMakeFiles/run_ai_test.dir/src/main.cpp.o.d"
+  "run_ai_test"
+  "run_ai_test.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/run_ai_test.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
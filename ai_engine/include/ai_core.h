@@ -0,0 +1,17 @@
+#ifndef AI_CORE_H
+#define AI_CORE_H
+
+// Interface exportée vers Python (chargée via ctypes dans game/calculateur.py)
+extern "C" {
+    // board : plateau 6x7 en int32, ligne par ligne (C-contiguous)
+    // mode  : 0 = Classique, 1 = Variante "1 pour 3"
+    int get_best_move(int* board, int depth, int mode);
+
+    // Remplit la table de transposition à l'avance (même plateau que le prochain get_best_move)
+    void warm_search(int* board, int depth, int mode);
+
+    // boards : n plateaux 6x7 à la suite, out_moves : n colonnes choisies
+    void get_best_moves_batch(int* boards, int n, int depth, int mode, int* out_moves);
+}
+
+#endif
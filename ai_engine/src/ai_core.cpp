@@ -2,6 +2,7 @@
 #include <iostream>
 #include <algorithm> // Pour max et min
 #include <limits>    // Pour numeric_limits
+#include <cstdint>   // Pour uint64_t
 using namespace std;
 
 
@@ -195,6 +196,43 @@ int score_position(int* board, int piece) {
 
 
 
+// --- TABLE DE TRANSPOSITION ---
+// Conserve d'un appel à l'autre la valeur des positions déjà analysées, ainsi que
+// le meilleur coup trouvé, essayé en premier lors des recherches suivantes.
+// Elle est remplie par get_best_move et par warm_search (appelés l'un après l'autre, jamais en même temps).
+
+enum TTFlag { TT_EXACT, TT_LOWER, TT_UPPER };
+
+struct TTEntry {
+    uint64_t key;   // 0 = case vide
+    int value;
+    int depth;      // Profondeur restante à laquelle la valeur a été calculée (réutilisée à cette profondeur seulement)
+    int flag;       // Valeur exacte, ou borne inférieure / supérieure (coupure alpha-beta)
+    int best_col;
+};
+
+const int TT_BITS = 20;
+static TTEntry tt[1 << TT_BITS];
+
+uint64_t position_key(int* board, bool maximizingPlayer) {
+    // Par colonne (7 bits) : pions de l'IA + masque des cases remplies, unique pour chaque colonne
+    uint64_t ai = 0, mask = 0;
+    for (int c = 0; c < COLS; c++) {
+        for (int r = ROWS - 1; r >= 0 && board[idx(r, c)] != 0; r--) {
+            uint64_t bit = 1ULL << (c * (ROWS + 1) + (ROWS - 1 - r));
+            mask |= bit;
+            if (board[idx(r, c)] == AI_PIECE) ai |= bit;
+        }
+    }
+    // Bit de poids fort : joueur au trait (la clé n'est jamais nulle grâce au +1)
+    return (ai + mask + 1) | (maximizingPlayer ? (1ULL << 63) : 0);
+}
+
+TTEntry& tt_slot(uint64_t key) {
+    return tt[(key * 0x9E3779B97F4A7C15ULL) >> (64 - TT_BITS)];
+}
+
+
 int minimax(int* board, int depth, int alpha, int beta, bool maximizingPlayer) {
     
     // ---  CONDITIONS D'ARRÊT  ---
@@ -215,12 +253,42 @@ int minimax(int* board, int depth, int alpha, int beta, bool maximizingPlayer) {
     
     // (Optionnel : Ajouter une vérification de match nul si le plateau est plein)
 
+    // ---  TABLE DE TRANSPOSITION  ---
+    uint64_t key = position_key(board, maximizingPlayer);
+    TTEntry& entry = tt_slot(key);
+    int first_col = -1;
+    if (entry.key == key) {
+        first_col = entry.best_col; // Ordre des coups : utile quelle que soit la profondeur
+        // Le score dépend de la profondeur (heuristique aux feuilles) : une valeur issue d'une
+        // recherche plus profonde changerait le coup joué à faible difficulté
+        if (entry.depth == depth) {
+            if (entry.flag == TT_EXACT) return entry.value;
+            if (entry.flag == TT_LOWER) alpha = max(alpha, entry.value);
+            if (entry.flag == TT_UPPER) beta = min(beta, entry.value);
+            if (beta <= alpha) return entry.value;
+        }
+    }
+    int alpha_orig = alpha;
+    int beta_orig = beta;
+
+    // Ordre de parcours : le meilleur coup connu d'abord, puis les colonnes de gauche à droite
+    int order[COLS];
+    int n = 0;
+    if (first_col >= 0) order[n++] = first_col;
+    for (int c = 0; c < COLS; c++) {
+        if (c != first_col) order[n++] = c;
+    }
+
+    int best_eval;
+    int best_col = -1;
+
     // ---  JOUEUR MAXIMISANT (C'est le tour de l'IA) ---
     if (maximizingPlayer) {
         int maxEval = -numeric_limits<int>::max(); // -Infini
         
         // On teste toutes les colonnes
-        for (int c = 0; c < COLS; c++) {
+        for (int k = 0; k < COLS; k++) {
+            int c = order[k];
             if (is_valid_location(board, c)) {
                 // On récupère la ligne où le pion tombe
                 int row = get_next_open_row(board, c);
@@ -236,6 +304,7 @@ int minimax(int* board, int depth, int alpha, int beta, bool maximizingPlayer) {
                 board[idx(row, c)] = 0;
                 
                 //  Mises à jour
+                if (eval > maxEval || best_col < 0) best_col = c;
                 maxEval = max(maxEval, eval); // Garde le meilleur score
                 alpha = max(alpha, eval);     // Met à jour le seuil Alpha
                 
@@ -245,14 +314,15 @@ int minimax(int* board, int depth, int alpha, int beta, bool maximizingPlayer) {
                 }
             }
         }
-        return maxEval;
+        best_eval = maxEval;
     }
 
     // --- JOUEUR MINIMISANT (C'est le tour de l'Humain) ---
     else {
         int minEval = numeric_limits<int>::max(); // +Infini
         
-        for (int c = 0; c < COLS; c++) {
+        for (int k = 0; k < COLS; k++) {
+            int c = order[k];
             if (is_valid_location(board, c)) {
                 int row = get_next_open_row(board, c);
                 
@@ -267,6 +337,7 @@ int minimax(int* board, int depth, int alpha, int beta, bool maximizingPlayer) {
                 board[idx(row, c)] = 0;
                 
                 // d. Mises à jour (On cherche le MINIMUM)
+                if (eval < minEval || best_col < 0) best_col = c;
                 minEval = min(minEval, eval);
                 beta = min(beta, eval);      // Met à jour le seuil Beta
                 
@@ -276,8 +347,20 @@ int minimax(int* board, int depth, int alpha, int beta, bool maximizingPlayer) {
                 }
             }
         }
-        return minEval;
+        best_eval = minEval;
     }
+
+    // ---  MÉMORISATION  ---
+    // (La référence reste valide : le tableau est statique, seule la case a pu être réécrite)
+    entry.key = key;
+    entry.value = best_eval;
+    entry.depth = depth;
+    entry.best_col = best_col;
+    if (best_eval <= alpha_orig) entry.flag = TT_UPPER;
+    else if (best_eval >= beta_orig) entry.flag = TT_LOWER;
+    else entry.flag = TT_EXACT;
+
+    return best_eval;
 }
 
 
@@ -287,9 +370,13 @@ extern "C" {
     /**
      * Cette fonction est celle que Python appelle.
      * Elle teste chaque colonne, lance le minimax, et retourne l'INDEX de la meilleure colonne.
+     * Le plateau est lu directement dans le buffer numpy (aucune copie côté C++).
+     * Le mode est reçu pour correspondre à la signature Python mais le moteur
+     * applique pour l'instant les règles classiques dans les deux cas.
      */
-    int get_best_move(int* board, int depth) {
-        
+    int get_best_move(int* board, int depth, int mode) {
+        (void)mode;
+
         int best_col = -1;
         int best_score = -numeric_limits<int>::max(); // Commence à -Infini
 
@@ -321,4 +408,26 @@ extern "C" {
         
         return best_col; 
     }
+
+    /**
+     * Préchauffe la table de transposition pendant que l'interface marque sa pause :
+     * approfondissement itératif jusqu'à depth - 1 sur le plateau où l'IA va jouer.
+     * Le get_best_move qui suit profite de l'ordre des coups mémorisé.
+     */
+    void warm_search(int* board, int depth, int mode) {
+        for (int d = 1; d < depth; d++) {
+            get_best_move(board, d, mode);
+        }
+    }
+
+    /**
+     * Version par lot : calcule le meilleur coup de n plateaux stockés à la suite
+     * (n * ROWS * COLS entiers) en un seul appel depuis Python.
+     * Le résultat de chaque plateau est écrit dans out_moves[i].
+     */
+    void get_best_moves_batch(int* boards, int n, int depth, int mode, int* out_moves) {
+        for (int i = 0; i < n; i++) {
+            out_moves[i] = get_best_move(boards + i * ROWS * COLS, depth, mode);
+        }
+    }
 }
@@ -2,42 +2,115 @@ import ctypes
 import numpy as np
 import os
 import platform
+from functools import lru_cache
+
+
+def _load_lib():
+    """Charge la librairie C++ compilée et déclare les signatures de ses fonctions."""
+    # Détection de l'extension selon l'OS
+    if platform.system() == "Darwin":
+        lib_name = "libai_lib.dylib"
+    elif platform.system() == "Windows":
+        lib_name = "ai_lib.dll"
+    else:
+        lib_name = "libai_lib.so"
+
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(current_dir)
+    
+    # Recherche du binaire compilé
+    lib_path = os.path.join(project_root, "ai_engine", "build", lib_name)
+
+    if not os.path.exists(lib_path):
+        lib_path_debug = os.path.join(project_root, "ai_engine", "build", "Debug", lib_name)
+        if os.path.exists(lib_path_debug):
+            lib_path = lib_path_debug
+        else:
+            raise FileNotFoundError("Librairie IA introuvable. Veuillez compiler le moteur C++.")
+
+    lib = ctypes.CDLL(lib_path)
+
+    # Définition de la signature de la fonction C++
+    # Le plateau est passé sous forme de pointeur brut vers un buffer 6x7 int32 ligne par ligne
+    # (même disposition mémoire que idx(r, c)), sans la validation par appel de ndpointer
+    lib.get_best_move.argtypes = [
+        ctypes.POINTER(ctypes.c_int32),
+        ctypes.c_int, # Profondeur
+        ctypes.c_int  # Mode de jeu
+    ]
+    lib.get_best_move.restype = ctypes.c_int
+
+    # Préchauffage de la table de transposition (même signature, sans résultat)
+    lib.warm_search.argtypes = [ctypes.POINTER(ctypes.c_int32), ctypes.c_int, ctypes.c_int]
+    lib.warm_search.restype = None
+
+    # Version par lot (réglage de la difficulté, tests de régression)
+    lib.get_best_moves_batch.argtypes = [
+        np.ctypeslib.ndpointer(dtype=np.int32, ndim=2, flags='C_CONTIGUOUS'),
+        ctypes.c_int, # Nombre de plateaux
+        ctypes.c_int, # Profondeur
+        ctypes.c_int, # Mode de jeu
+        np.ctypeslib.ndpointer(dtype=np.int32, ndim=1, flags='C_CONTIGUOUS')
+    ]
+    lib.get_best_moves_batch.restype = None
+
+    return lib
+
+
+# Chargement unique à l'import : une librairie absente est détectée dès le démarrage.
+# Toute erreur de chargement (binaire absent, corrompu ou compilé depuis une ancienne version
+# sans certaines fonctions) est conservée et relevée par AIModel() : le jeu à 2 joueurs reste utilisable
+try:
+    _LIB = _load_lib()
+    _LIB_ERROR = None
+except (OSError, AttributeError) as e: # OSError couvre FileNotFoundError
+    _LIB = None
+    _LIB_ERROR = e
+
 
 class AIModel:
     """Interface Python pour la librairie C++ de l'IA."""
     def __init__(self):
-        # Détection de l'extension selon l'OS
-        if platform.system() == "Darwin":
-            lib_name = "libai_lib.dylib"
-        elif platform.system() == "Windows":
-            lib_name = "ai_lib.dll"
-        else:
-            lib_name = "libai_lib.so"
-
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(current_dir)
-        
-        # Recherche du binaire compilé
-        lib_path = os.path.join(project_root, "ai_engine", "build", lib_name)
-
-        if not os.path.exists(lib_path):
-            lib_path_debug = os.path.join(project_root, "ai_engine", "build", "Debug", lib_name)
-            if os.path.exists(lib_path_debug):
-                lib_path = lib_path_debug
-            else:
-                raise FileNotFoundError("Librairie IA introuvable. Veuillez compiler le moteur C++.")
-
-        self.lib = ctypes.CDLL(lib_path)
-
-        # Définition de la signature de la fonction C++
-        self.lib.get_best_move.argtypes = [
-            np.ctypeslib.ndpointer(dtype=np.int32, ndim=1, flags='C_CONTIGUOUS'),
-            ctypes.c_int, # Profondeur
-            ctypes.c_int  # Mode de jeu
-        ]
-        self.lib.get_best_move.restype = ctypes.c_int
+        if _LIB is None:
+            raise _LIB_ERROR
+        self.lib = _LIB
+
+        # Buffer réutilisé à chaque appel (pas d'allocation par tour de l'IA)
+        self._buf = np.empty((6, 7), dtype=np.int32)
+        self._buf_ptr = self._buf.ctypes.data_as(ctypes.POINTER(ctypes.c_int32))
 
     def get_best_move(self, board, depth=4, mode=0):
         """Appelle la fonction Minimax du moteur C++."""
-        board_flat = board.flatten().astype(np.int32)
-        return self.lib.get_best_move(board_flat, depth, mode)
+        # Copie (et élargissement int8 -> int32) dans le buffer préalloué
+        np.copyto(self._buf, board)
+        return self.lib.get_best_move(self._buf_ptr, depth, mode)
+
+    def warm_search(self, board, depth=4, mode=0):
+        """
+        Lance une recherche préliminaire (jusqu'à depth - 1) pour remplir la table de transposition.
+        ctypes relâche le GIL pendant l'appel : peut tourner dans un thread pendant la pause de l'interface,
+        à condition d'être terminé avant le get_best_move suivant (le buffer est partagé).
+        """
+        np.copyto(self._buf, board)
+        self.lib.warm_search(self._buf_ptr, depth, mode)
+
+    def get_best_moves(self, boards, depth=4, mode=0):
+        """Calcule le meilleur coup de chaque plateau d'un lot en un seul appel au moteur C++."""
+        boards = np.asarray(boards)
+        # Forme vérifiée avant le reshape : un lot (7, 6, 6) compte lui aussi un multiple de 42 cases
+        if boards.shape[-2:] != (6, 7) and boards.shape[-1:] != (6 * 7,):
+            raise ValueError(f"Plateaux de forme (n, 6, 7) ou (n, 42) attendus, reçu {boards.shape}")
+        boards_c = np.ascontiguousarray(np.reshape(boards, (-1, 6 * 7)), dtype=np.int32)
+        out = np.empty(len(boards_c), dtype=np.int32)
+        self.lib.get_best_moves_batch(boards_c, len(boards_c), depth, mode, out)
+        return out
+
+
+@lru_cache(maxsize=1)
+def get_ai_model() -> AIModel:
+    """
+    Renvoie l'instance partagée de AIModel.
+    Le moteur C++ ne garde d'un appel à l'autre que sa table de transposition, indépendante
+    de la partie en cours : le partage entre parties est sans risque.
+    """
+    return AIModel()
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from game.gamemanager import variantes, InvalidMove
 from game.graphicinterface import Interface
 
@@ -9,15 +10,16 @@ class Controller:
         self._variantes = variantes
         self._gestionnaire = None
         self._in_menu = True
-        self._in_game = False
+        self._ai_worker = ThreadPoolExecutor(max_workers=1) # Préchauffage de l'IA pendant la pause
 
     def start(self):
         """Lance l'application."""
+        # Pas d'attente active : chaque étape bloque dans une QEventLoop jusqu'à une action
+        # de l'utilisateur ; _in_menu décide seul de l'étape (menu ou partie en cours)
         while self._interface._running:
-            if self._in_menu:
-                self.menu_principal()
-            elif self._in_game:
-                self.game_loop()
+            handler = self.menu_principal if self._in_menu else self.game_loop
+            handler()
+        self._ai_worker.shutdown()
 
     def menu_principal(self):
         #  ETAPE 1 : Choix de la Variante 
@@ -60,40 +62,48 @@ class Controller:
         )
         
         self._in_menu = False
-        self._in_game = True
 
     def game_loop(self):
         """Boucle principale d'une partie."""
+        gm = self._gestionnaire
+
         # Récupération de l'action humaine via l'interface
-        move = self._interface.send_game(
-            self._gestionnaire.current_player,
-            self._gestionnaire.board
-        )
+        move = self._interface.send_game(gm.current_player, gm.board)
 
         if move is None:  # Retour au Menu
-            self._in_game = False
             self._in_menu = True
             self._gestionnaire = None
             return
 
         try:
             #  TOUR HUMAIN 
-            self._gestionnaire.play(move)
+            gm.play(move)
 
             if self.check_game_end():
                 return 
 
             #  TOUR IA 
-            if getattr(self._gestionnaire, 'mode_solo', False):
+            if gm.mode_solo:
                 
+                # Le C++ commence à chercher en arrière-plan pendant la pause (plateau déjà connu)
+                warm_up = None
+                if gm.ai_engine and gm.current_player == 1:
+                    warm_up = self._ai_worker.submit(
+                        gm.ai_engine.warm_search, gm.board, gm.difficulty, gm.ai_mode
+                    )
+
                 # Mise à jour visuelle avant le coup de l'IA
-                self._interface.refresh_only(self._gestionnaire.current_player, self._gestionnaire.board)
+                self._interface.refresh_only(gm.current_player, gm.board)
                 
                 # Pause pour la fluidité de l'animation
                 self._interface.pause(700) 
                 
+                # Le préchauffage doit être terminé avant le vrai calcul (buffer partagé)
+                if warm_up is not None:
+                    warm_up.result()
+
                 # Calcul et exécution du coup de l'IA
-                self._gestionnaire.play_ai_turn()
+                gm.play_ai_turn()
 
                 if self.check_game_end():
                     return
@@ -103,25 +113,24 @@ class Controller:
 
     def check_game_end(self):
         """Vérifie les conditions de fin de partie (Victoire, Égalité) ou les événements."""
+        gm = self._gestionnaire
         
-        if self._gestionnaire.victory:
-            self._interface.refresh_only(self._gestionnaire.current_player, self._gestionnaire.board)
-            self._interface.notify_victory(self._gestionnaire.current_player)
-            self._in_game = False
+        if gm.victory:
+            self._interface.refresh_only(gm.current_player, gm.board)
+            self._interface.notify_victory(gm.current_player)
             self._in_menu = True
             return True
 
-        elif self._gestionnaire.draw:
-            self._interface.refresh_only(self._gestionnaire.current_player, self._gestionnaire.board)
+        elif gm.draw:
+            self._interface.refresh_only(gm.current_player, gm.board)
             self._interface.notify_draw()
-            self._in_game = False
             self._in_menu = True
             return True
 
         # Gestion des messages liés aux événements de variante
-        elif getattr(self._gestionnaire, 'event', False):
-            self._interface.notify_message(self._gestionnaire.message_event)
-            self._interface.refresh_only(self._gestionnaire.current_player, self._gestionnaire.board)
+        elif gm.event:
+            self._interface.notify_message(gm.message_event)
+            self._interface.refresh_only(gm.current_player, gm.board)
             return False 
 
         return False
@@ -1,6 +1,38 @@
+import logging
 import numpy as np
 from abc import ABC, abstractmethod
-from game.calculateur import AIModel
+from functools import lru_cache
+from game.calculateur import get_ai_model
+
+logger = logging.getLogger(__name__)
+
+# Directions (dr, dc) : Horizontal, Vertical, Diagonale \, Diagonale /
+_DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+@lru_cache(maxsize=None)
+def _shifts(height: int) -> tuple:
+    """Décalage de bits correspondant à chaque direction dans un bitboard de hauteur height."""
+    stride = height + 1
+    return tuple(abs(dc * stride - dr) for dr, dc in _DIRECTIONS)
+
+
+@lru_cache(maxsize=None)
+def _cover_masks(height: int, width: int, n: int) -> tuple:
+    """
+    Précalcule, pour chaque case et chaque direction, le masque des bits de départ
+    des alignements de n pions qui contiennent cette case. Calculé une seule fois par taille.
+    """
+    stride = height + 1
+    masks = []
+    for r in range(height):
+        row = []
+        for c in range(width):
+            bit = 1 << (c * stride + height - 1 - r)
+            row.append(tuple(sum(bit >> (shift * i) for i in range(n))
+                             for shift in _shifts(height)))
+        masks.append(tuple(row))
+    return tuple(masks)
 
 
 class InvalidMove(Exception):
@@ -10,52 +42,117 @@ class InvalidMove(Exception):
 class Gestionnaire(ABC):
     """Classe abstraite du jeu gérant l'état du plateau et les règles communes."""
     name: str = "Jeu"
+    ai_mode: int = 0  # Mode transmis au moteur C++ (0 = Classique, 1 = Variante)
 
     def __init__(self, mode_solo=False, difficulty=4):
         self._width = 7
         self._height = 6
-        self._board = np.zeros((self._height, self._width), dtype=int)
+        self._board = np.zeros((self._height, self._width), dtype=np.int8)  # Valeurs dans {-1, 0, 1}
         self._current_player = -1  # 1 = Rouge, -1 = Jaune
         self._victory = False
         self._draw = False
         self._event = False
         self._message_event = ""
+        self._moves_played = 0  # Nombre de pions sur le plateau (resynchronisé avec les bitboards)
+
+        # Poids de chaque case dans le bitboard : colonne par colonne, du bas vers le haut
+        rows, cols = np.indices((self._height, self._width))
+        self._bit_weights = np.left_shift(1, cols * (self._height + 1) + (self._height - 1 - rows), dtype=np.int64)
+        self._shifts = _shifts(self._height)
+        self._bitboards = {1: 0, -1: 0}
+        self._bitboards_key = self._board.tobytes()
 
         self.mode_solo = mode_solo
         self.difficulty = difficulty # Profondeur de recherche du Minimax
         self.ai_engine = None
         
         if self.mode_solo:
-            print(f"Initialisation du mode SOLO (Difficulté {difficulty})")
+            logger.debug("Initialisation du mode SOLO (Difficulté %s)", difficulty)
             try:
-                self.ai_engine = AIModel() # Chargement de la librairie C++
+                self.ai_engine = get_ai_model() # Chargement de la librairie C++ (une seule fois)
             except Exception as e:
-                print(f"Erreur critique : Impossible de charger l'IA C++. {e}")
+                logger.error("Erreur critique : Impossible de charger l'IA C++. %s", e)
+
+    def bitboard(self, player: int) -> int:
+        """
+        Renvoie les pions d'un joueur encodés sous forme d'entier (bitboard).
+        Chaque colonne occupe height + 1 bits (le bit du haut reste vide comme sentinelle),
+        le bit 0 de chaque colonne correspondant à la ligne du bas.
+        """
+        # Recalcul complet uniquement si le plateau a été modifié hors de _place_piece,
+        # avec le compteur de pions, pour que la détection d'égalité reste juste
+        key = self._board.tobytes()
+        if key != self._bitboards_key:
+            self._bitboards = {p: int(self._bit_weights[self._board == p].sum()) for p in (1, -1)}
+            self._moves_played = int(np.count_nonzero(self._board))
+            self._bitboards_key = key
+        return self._bitboards[player]
+
+    def _landing_row(self, col: int) -> int:
+        """Renvoie la ligne où tombe un pion joué dans la colonne col."""
+        if col < 0 or col >= self._width:
+            raise InvalidMove("Colonne pleine ou invalide.")
+
+        # Les pions sont empilés depuis le bas : leur nombre donne la hauteur de la colonne
+        filled = np.count_nonzero(self._board[:, col])
+        if filled >= self._height:
+            raise InvalidMove("Colonne pleine ou invalide.")
+        return self._height - 1 - filled
+
+    def _place_piece(self, row: int, col: int, player: int) -> None:
+        """Pose un pion sur le plateau en mettant à jour le bitboard du joueur."""
+        bb = self.bitboard(player)
+        self._board[row, col] = player
+        self._bitboards[player] = bb | int(self._bit_weights[row, col])
+        self._bitboards_key = self._board.tobytes()
+        self._moves_played += 1
+
+    def _refresh_column(self, col: int) -> None:
+        """Recalcule les bits d'une seule colonne après une modification directe du plateau."""
+        stride = self._height + 1
+        col_mask = ((1 << self._height) - 1) << (col * stride)
+        weights = self._bit_weights[:, col]
+        for p in (1, -1):
+            col_bits = int(weights[self._board[:, col] == p].sum())
+            self._bitboards[p] = (self._bitboards[p] & ~col_mask) | col_bits
+        self._bitboards_key = self._board.tobytes()
 
     def check_victory(self, move: tuple[int, int], player: int, n : int) -> bool:
         """Vérifie si le coup joué complète un alignement de taille n."""
         r, c = move
-        # Directions : Horizontal, Vertical, Diagonale \, Diagonale /
-        directions = [(0, 1), (1, 0), (1, 1), (1, -1)]
-
-        for dr, dc in directions:
-            count = 1 # On compte le pion que l'on vient de poser
-
-            # Sens positif
-            for i in range(1, n):
-                nr, nc = r + dr*i, c + dc*i
-                if 0 <= nr < self.height and 0 <= nc < self.width and self.board[nr, nc] == player:
-                    count += 1
-                else: break
-
-            # Sens négatif
-            for i in range(1, n):
-                nr, nc = r - dr*i, c - dc*i
-                if 0 <= nr < self.height and 0 <= nc < self.width and self.board[nr, nc] == player:
-                    count += 1
-                else: break
-
-            if count >= n:
+        H, W = self._height, self._width
+        shifts = self._shifts
+        steps = range(1, n)
+        bb = self.bitboard(player)
+        covers = _cover_masks(H, W, n)[r][c]
+
+        for shift, cover in zip(shifts, covers):
+            # Candidats : bits de départ des alignements qui contiennent le coup joué (cover),
+            # éliminés au fur et à mesure ; on arrête la direction dès qu'il n'en reste aucun
+            runs = bb & cover
+            for i in steps:
+                if not runs:
+                    break
+                runs &= bb >> (shift * i)
+
+            if runs:
+                return True
+        return False
+
+    def has_alignment(self, player: int, n: int) -> bool:
+        """Vérifie si le joueur possède un alignement de taille n n'importe où sur le plateau."""
+        shifts = self._shifts
+        steps = range(1, n)
+        bb = self.bitboard(player)
+
+        for shift in shifts:
+            runs = bb
+            for i in steps:
+                if not runs:
+                    break
+                runs &= bb >> (shift * i)
+
+            if runs:
                 return True
         return False
     
@@ -67,9 +164,9 @@ class Gestionnaire(ABC):
         if not self.ai_engine:
             return None
         
-        print("L'IA réfléchit...")
-        col = self.ai_engine.get_best_move(self.board, depth=self.difficulty)
-        print(f"L'IA a choisi la colonne {col}")
+        logger.debug("L'IA réfléchit...")
+        col = self.ai_engine.get_best_move(self.board, depth=self.difficulty, mode=self.ai_mode)
+        logger.debug("L'IA a choisi la colonne %s", col)
         return col
 
     @abstractmethod
@@ -111,24 +208,16 @@ class ClassicGame(Gestionnaire):
     def play(self, move: tuple[int, int]) -> None:
         _, col = move
 
-        # 1. Validation du coup
-        if col < 0 or col >= self.width or self.board[0, col] != 0:
-            raise InvalidMove("Colonne pleine ou invalide.")
-
-        # 2. Application de la gravité
-        r_found = -1
-        for r in range(self.height - 1, -1, -1):
-            if self.board[r, col] == 0:
-                self.board[r, col] = self._current_player
-                r_found = r
-                break
+        # 1. Validation du coup et 2. Application de la gravité
+        r_found = self._landing_row(col)
+        self._place_piece(r_found, col, self._current_player)
 
         # 3. Vérification de la victoire
         if self.check_victory((r_found, col), self._current_player, 4):
             self._victory = True
 
         # 4. Vérification de l'égalité (grille pleine)
-        elif np.all(self.board != 0):
+        elif self._moves_played >= self._width * self._height:
             self._draw = True
 
         # 5. Changement de tour
@@ -146,12 +235,8 @@ class ClassicGame(Gestionnaire):
         if self._current_player != 1:
             return
 
-        # Appel au moteur C++
-        # Conversion du plateau en tableau 1D d'entiers 32 bits
-        board_c = self.board.flatten().astype(np.int32)
-        
-        # Mode 0 correspond au jeu classique
-        best_col = self.ai_engine.get_best_move(board_c, depth=self.difficulty, mode=0)
+        # Appel au moteur C++ (la conversion du plateau est gérée par AIModel)
+        best_col = self.ai_engine.get_best_move(self.board, depth=self.difficulty, mode=self.ai_mode)
         
         # On exécute le coup
         self.play((0, best_col))
@@ -161,6 +246,8 @@ class ClassicGame(Gestionnaire):
 class Variante_1(Gestionnaire):
     """Variante '1 pour 3' : Aligner 3 pions permet de supprimer un pion adverse."""
     name = "1 pour 3"
+    ai_mode = 1
+    _col_priority = np.array([3, 2, 4, 1, 5, 0, 6])
 
     def __init__(self, mode_solo=False, difficulty=4):
         super().__init__(mode_solo=mode_solo, difficulty=difficulty)
@@ -170,12 +257,13 @@ class Variante_1(Gestionnaire):
     def get_best_victim(self, opponent_player):
         """Détermine le meilleur pion adverse à supprimer (stratégie IA)."""
         # Priorité : Centre du plateau, du bas vers le haut
-        priority_cols = [3, 2, 4, 1, 5, 0, 6]
-        for col in priority_cols:
-            for row in range(self.height - 1, -1, -1):
-                if self.board[row, col] == opponent_player:
-                    return (row, col)
-        return None
+        mask = self._board[::-1, self._col_priority] == opponent_player
+        if not mask.any():
+            return None
+
+        # Premier pion trouvé en parcourant les colonnes par priorité (ordre colonne par colonne)
+        ci, ri = divmod(int(np.argmax(mask.T)), self._height)
+        return (self._height - 1 - ri, int(self._col_priority[ci]))
 
     def play_ai_turn(self):
         """Logique spécifique de l'IA pour la variante (pose et suppression)."""
@@ -183,12 +271,11 @@ class Variante_1(Gestionnaire):
             return
 
         # 1. Calcul du meilleur coup (Mode 1 = Variante)
-        board_c = self.board.flatten().astype(np.int32)
-        best_col = self.ai_engine.get_best_move(board_c, depth=self.difficulty, mode=1)
+        best_col = self.ai_engine.get_best_move(self.board, depth=self.difficulty, mode=self.ai_mode)
 
         # 2. L'IA joue le coup (Phase de pose)
         try:
-            self.play((0, best_col))
+            self._play_place((0, best_col))
         except InvalidMove:
             return
 
@@ -197,94 +284,85 @@ class Variante_1(Gestionnaire):
             target = self.get_best_victim(-1) # Cible l'humain (-1)
             
             if target:
-                print(f"L'IA supprime le pion en {target}")
-                self.play(target) # Déclenche la phase de suppression
+                logger.debug("L'IA supprime le pion en %s", target)
+                self._play_remove(target) # Phase de suppression
             else:
                 self._event = False
                 self._current_player *= -1
 
     def play(self, move: tuple[int, int]) -> None:
         """Gestion du tour : soit pose de pion, soit suppression selon l'état de l'événement."""
+        (self._play_remove if self._event else self._play_place)(move)
+
+    def _play_place(self, move: tuple[int, int]) -> None:
+        """Tour normal : le joueur pose un pion dans la colonne choisie."""
+        _, col = move
+
+        # Application de la gravité
+        r_found = self._landing_row(col)
+        self._place_piece(r_found, col, self._current_player)
         
-        #  CAS 1 : TOUR NORMAL (POSER UN PION) 
-        if not self._event:
-            _, col = move
-
-            if col < 0 or col >= self.width or self.board[0, col] != 0:
-                raise InvalidMove("Colonne pleine ou invalide.")
-
-            # Application de la gravité
-            r_found = -1
-            for r in range(self.height - 1, -1, -1):
-                if self.board[r, col] == 0:
-                    self.board[r, col] = self._current_player
-                    r_found = r
-                    break
-            
-            #  PRIORITÉS DES RÈGLES 
+        #  PRIORITÉS DES RÈGLES 
 
-            # 1. Victoire (4 alignés) -> Fin de partie
-            if self.check_victory((r_found, col), self._current_player, 4):
-                self._victory = True
+        # 1. Victoire (4 alignés) -> Fin de partie
+        if self.check_victory((r_found, col), self._current_player, 4):
+            self._victory = True
 
-            # 2. Événement (3 alignés) -> Action bonus (Suppression)
-            elif self.check_victory((r_found, col), self._current_player, 3):
-                self._event = True 
-                # On ne change pas de joueur pour permettre l'action de suppression
+        # 2. Événement (3 alignés) -> Action bonus (Suppression)
+        elif self.check_victory((r_found, col), self._current_player, 3):
+            self._event = True 
+            # On ne change pas de joueur pour permettre l'action de suppression
 
-            # 3. Égalité
-            elif np.all(self.board != 0):
-                self._draw = True
+        # 3. Égalité
+        elif self._moves_played >= self._width * self._height:
+            self._draw = True
 
-            # 4. Tour suivant standard
-            else:
-                self._current_player *= -1
-        
-        #  CAS 2 : ÉVÉNEMENT (SUPPRIMER UN PION) 
+        # 4. Tour suivant standard
         else:
-            row, col = move
-            # Détermination de la cible (Si je suis 1, je vise -1)
-            other_player = -1 if self.current_player == 1 else 1
-            
-            if (row < 0 or row >= self.height or 
-                col < 0 or col >= self.width or 
-                self.board[row, col] != other_player):
-                raise InvalidMove("Vous devez cliquer sur un pion adverse !")
-
-            # Suppression du pion
-            self._board[row, col] = 0
-
-            # Gravité après suppression (Chute des pions du dessus)
-            for r in range(row, 0, -1):
-                self._board[r, col] = self._board[r-1, col]
-            self._board[0, col] = 0
-
-            # Vérification des conditions de victoire après la chute
-            victoire_moi = False
-            victoire_autre = False
-
-            # On scanne la colonne modifiée
-            for r in range(self.height):
-                pion = self.board[r, col]
-                if pion != 0:
-                    if self.check_victory((r, col), pion, 4):
-                        if pion == self.current_player:
-                            victoire_moi = True
-                        else:
-                            victoire_autre = True
-
-            # Résolution des conflits de victoire post-gravité
-            if victoire_moi and victoire_autre:
-                self._draw = True
-            elif victoire_moi:
-                self._victory = True
-            elif victoire_autre:
-                self._victory = True 
-                self._current_player = other_player # L'adversaire gagne suite à notre action
-            else:
-                self._current_player *= -1
+            self._current_player *= -1
 
-            self._event = False
+    def _play_remove(self, move: tuple[int, int]) -> None:
+        """Événement : le joueur retire un pion adverse après avoir aligné 3 pions."""
+        row, col = move
+        # Détermination de la cible (Si je suis 1, je vise -1)
+        other_player = -1 if self._current_player == 1 else 1
+        H, W, B = self._height, self._width, self._board
+
+        if (row < 0 or row >= H or 
+            col < 0 or col >= W or 
+            B[row, col] != other_player):
+            raise InvalidMove("Vous devez cliquer sur un pion adverse !")
+
+        # Synchronise les bitboards avant de modifier la colonne
+        self.bitboard(self._current_player)
+
+        # Suppression du pion
+        self._board[row, col] = 0
+        self._moves_played -= 1
+
+        # Gravité après suppression (Chute des pions du dessus)
+        # numpy gère le recouvrement entre les deux tranches de la colonne
+        self._board[1:row+1, col] = self._board[0:row, col]
+        self._board[0, col] = 0
+        self._refresh_column(col)
+
+        # Vérification des conditions de victoire après la chute
+        # (seule la colonne modifiée a pu créer un nouvel alignement)
+        victoire_moi = self.has_alignment(self._current_player, 4)
+        victoire_autre = self.has_alignment(other_player, 4)
+
+        # Résolution des conflits de victoire post-gravité
+        if victoire_moi and victoire_autre:
+            self._draw = True
+        elif victoire_moi:
+            self._victory = True
+        elif victoire_autre:
+            self._victory = True 
+            self._current_player = other_player # L'adversaire gagne suite à notre action
+        else:
+            self._current_player *= -1
+
+        self._event = False
 
 
 # Liste des variantes disponibles
@@ -1,11 +1,20 @@
 import sys
+import math
 import numpy as np
-from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
-                             QPushButton, QLabel, QMessageBox)
-from PyQt6.QtGui import QPainter, QColor, QBrush, QFont
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QSizePolicy,
+                             QPushButton, QLabel, QButtonGroup,
+                             QStackedWidget)
+from PyQt6.QtGui import QPainter, QColor, QBrush, QFont, QPixmap, QPalette
 from PyQt6.QtCore import Qt, QRectF, pyqtSignal, QEventLoop, QTimer
+from PyQt6 import sip
 from typing import Optional
 
+# Couleurs construites une seule fois à l'import (pas d'analyse de chaîne "#rrggbb" à chaque rendu)
+_RED = QColor(0xE7, 0x4C, 0x3C)
+_YEL = QColor(0xF1, 0xC4, 0x0F)
+_EMPTY = QColor(0xEC, 0xF0, 0xF1)
+_BG = QColor(0x34, 0x49, 0x5E)
+
 class BoardWidget(QWidget):
     """Widget personnalisé pour le rendu graphique du plateau."""
     cell_cliquee = pyqtSignal(int, int)  # Signal émettant (row, col) lors d'un clic
@@ -15,60 +24,170 @@ class BoardWidget(QWidget):
         self.board = board_ref
         self.setMinimumSize(400, 350)
 
+        # Proportions de la grille imposées au layout : cases carrées sans marges perdues
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+
+        # Le pixmap du cache recouvre tout le widget : Qt n'a pas à effacer le fond avant paintEvent
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+        self.setAutoFillBackground(False)
+
+        # Rendu mis en cache : redessiné en entier si la taille change, case par case sinon
+        self._cache_pixmap = None
+        self._cache_key = None   # (largeur, hauteur, dpr) du pixmap
+        # Copie du plateau tel qu'il est dessiné dans le pixmap : mise à jour par set_board seulement,
+        # le tableau du Gestionnaire pouvant être modifié sur place entre deux appels
+        self._cache_board = None
+        self._dirty = None       # Cases changées par set_board, pas encore redessinées dans le pixmap
+
+        # Géométrie de la grille, recalculée seulement au redimensionnement
+        self._size = None
+
+        # Pinceaux construits une seule fois : Rouge, Jaune, Vide
+        self._brushes = {-1: QBrush(_RED), 1: QBrush(_YEL), 0: QBrush(_EMPTY)}
+
+    def _recompute_geometry(self) -> None:
+        """Calcule la taille des cases, les marges et la position de chaque ligne / colonne."""
+        w, h = self.width(), self.height()
+        self._rows, self._cols = self.board.shape
+        # min conservé : heightForWidth n'est qu'une préférence (fenêtre plus large que haute)
+        self._size = min(w / self._cols, h / self._rows)
+        self._inv_size = 1.0 / self._size
+        self._radius = self._size * 0.8
+        self._off_x = (w - self._cols * self._size) / 2
+        self._off_y = (h - self._rows * self._size) / 2
+        self._cell_offset = (self._size - self._radius) / 2
+        self._xs = self._off_x + np.arange(self._cols) * self._size + self._cell_offset
+        self._ys = self._off_y + np.arange(self._rows) * self._size + self._cell_offset
+
+    def hasHeightForWidth(self) -> bool:
+        return True
+
+    def heightForWidth(self, width: int) -> int:
+        rows, cols = self.board.shape if self.board is not None else (6, 7)
+        return width * rows // cols
+
+    def resizeEvent(self, event):
+        self._size = None # Recalcul paresseux au prochain paint / clic
+        self._cache_key = None
+        super().resizeEvent(event)
+
+    def _cell_rect(self, row: int, col: int) -> QRectF:
+        return QRectF(self._off_x + col * self._size, self._off_y + row * self._size, self._size, self._size)
+
+    def _snapshot(self) -> None:
+        """Copie le plateau affiché ; le prochain rendu redessinera tout le pixmap."""
+        self._cache_board = self.board.copy()
+        self._dirty = np.zeros(self.board.shape, dtype=bool)
+        self._cache_key = None
+
+    def set_board(self, board) -> None:
+        """Affiche un (nouveau) plateau dans le widget ; seules les cases modifiées sont rafraîchies."""
+        if board is not self.board:
+            self.board = board
+            self._size = None
+            self._cache_key = None
+        if self._cache_key is None:
+            self._snapshot()
+            self.update()
+            return
+
+        # Le diff est enregistré ici et non au rendu : un paintEvent partiel (message, exposition)
+        # ne peut donc pas absorber des cases qui ne seraient jamais recopiées à l'écran
+        changed = board != self._cache_board
+        if not changed.any(): return
+        np.copyto(self._cache_board, board)
+        self._dirty |= changed
+        for row, col in zip(*np.nonzero(changed)):
+            self.update(self._cell_rect(row, col).toAlignedRect())
+
+    def invalidate(self) -> None:
+        """Force le prochain paintEvent à redessiner le plateau."""
+        self._cache_key = None
+        self.update()
+
     def paintEvent(self, event):
         if self.board is None: return
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr)
+
+        if self._cache_board is None: self._snapshot() # Plateau passé au constructeur
+
+        if key != self._cache_key:
+            pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            self._render(pixmap)
+            self._cache_pixmap = pixmap
+            self._cache_key = key
+            self._dirty[:] = False
+        elif self._dirty.any():
+            self._render(self._cache_pixmap, *np.nonzero(self._dirty))
+            self._dirty[:] = False
+
+        # Le painter est limité par Qt à la zone invalidée (event.rect()) ; les cases redessinées
+        # hors de cette zone restent demandées par les update() de set_board
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._cache_pixmap)
+
+    def _render(self, device, rr=None, cc=None):
+        """Dessine sur device (le pixmap du cache) tout le plateau affiché, ou seulement les cases (rr, cc)."""
+        if self._size is None: self._recompute_geometry()
+        xs, ys, radius = self._xs, self._ys, self._radius
+
+        painter = QPainter(device)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # Calcul des dimensions dynamiques
-        w, h = self.width(), self.height()
-        rows, cols = self.board.shape
-        size = min(w / cols, h / rows)
-        radius = size * 0.8
-        off_x = (w - cols * size) / 2
-        off_y = (h - rows * size) / 2
-
-        # Fond
-        painter.fillRect(self.rect(), QColor("#34495e"))
-
-        # Dessin des pions
-        for r in range(rows):
-            for c in range(cols):
-                val = self.board[r, c]
-                if val == -1: color = QColor("#e74c3c")   # Rouge
-                elif val == 1: color = QColor("#f1c40f") # Jaune
-                else: color = QColor("#ecf0f1")           # Vide
-
-                x = off_x + c * size + (size - radius)/2
-                y = off_y + r * size + (size - radius)/2
-
-                painter.setBrush(QBrush(color))
-                painter.setPen(Qt.PenStyle.NoPen)
-                painter.drawEllipse(QRectF(x, y, radius, radius))
+        # Fond : tout le widget, ou uniquement les cases à redessiner
+        if rr is None:
+            painter.fillRect(self.rect(), _BG)
+            rr, cc = np.indices(self._cache_board.shape).reshape(2, -1)
+        else:
+            for row, col in zip(rr, cc):
+                painter.fillRect(self._cell_rect(row, col), _BG)
+
+        # Dessin des pions, une couleur à la fois
+        painter.setPen(Qt.PenStyle.NoPen)
+        values = self._cache_board[rr, cc]
+        for val, brush in self._brushes.items():
+            sel = values == val
+            n = np.count_nonzero(sel)
+            if n == 0: continue
+
+            # Tableau natif de QRectF rempli directement par numpy (x, y, largeur, hauteur)
+            rects = sip.array(QRectF, n)
+            coords = np.frombuffer(rects, dtype=np.float64).reshape(-1, 4)
+            coords[:, 0] = xs[cc[sel]]
+            coords[:, 1] = ys[rr[sel]]
+            coords[:, 2:] = radius
+
+            painter.setBrush(brush)
+            for rect in rects:
+                painter.drawEllipse(rect)
+        painter.end()
 
     def mousePressEvent(self, event):
+        if self.board is None: return
         if event.button() == Qt.MouseButton.LeftButton:
             # Conversion Coordonnées Pixel -> Indices Grille
-            w, h = self.width(), self.height()
-            rows, cols = self.board.shape
-            size = min(w / cols, h / rows)
-            
-            off_x = (w - cols * size) / 2
-            off_y = (h - rows * size) / 2
+            if self._size is None: self._recompute_geometry()
 
-            x_click = event.position().x() - off_x
-            y_click = event.position().y() - off_y
+            x_click = event.position().x() - self._off_x
+            y_click = event.position().y() - self._off_y
 
-            col = int(x_click // size)
-            row = int(y_click // size)
+            # floor et non int() : un clic dans la marge gauche / haute doit donner -1, pas 0
+            col = math.floor(x_click * self._inv_size)
+            row = math.floor(y_click * self._inv_size)
 
-            if 0 <= col < cols and 0 <= row < rows:
+            if 0 <= col < self._cols and 0 <= row < self._rows:
                 self.cell_cliquee.emit(row, col)
 
 
 class Interface:
     """Gère la fenêtre principale et la synchronisation avec le Contrôleur."""
-    def __init__(self):
+    TOAST_MS = 1500 # Durée d'affichage des messages
+
+    def __init__(self, silent: bool = False):
+        self.silent = silent # Pas de messages (parties IA contre IA, tests)
         self.app = QApplication.instance() or QApplication(sys.argv)
 
         self.window = QMainWindow()
@@ -76,15 +195,76 @@ class Interface:
         self.window.resize(600, 650)
         self.window.setStyleSheet("background-color: #2c3e50;")
 
-        self.central_widget = QWidget()
-        self.window.setCentralWidget(self.central_widget)
-        self.layout = QVBoxLayout(self.central_widget)
+        # Deux pages persistantes (menu, partie) : changer d'écran ne crée ni ne détruit aucun widget
+        self.stack = QStackedWidget()
+        self.window.setCentralWidget(self.stack)
+
+        # Page de jeu : widgets créés une seule fois et mis à jour à chaque coup
+        self.game_page = QWidget()
+        game_layout = QVBoxLayout(self.game_page)
+
+        self.status_label = QLabel()
+        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        status_font = self.status_label.font()
+        status_font.setPixelSize(24)
+        status_font.setBold(True)
+        self.status_label.setFont(status_font)
+
+        # Une palette par joueur : changer de couleur ne passe pas par le parseur de feuilles de style
+        self._status_palettes = {}
+        for p in (-1, 1):
+            palette = QPalette(self.status_label.palette())
+            palette.setColor(QPalette.ColorRole.WindowText, self._get_player_info(p)[1])
+            self._status_palettes[p] = palette
+
+        self.board_widget = BoardWidget(None)
+        self.board_widget.cell_cliquee.connect(self._on_cell_clicked)
+        self._awaiting_move = False
+
+        self.back_button = QPushButton("Retour Menu")
+        self.back_button.setStyleSheet("background-color: #95a5a6; color: white;")
+        self.back_button.clicked.connect(lambda: self._resume(None))
+
+        for widget in (self.status_label, self.board_widget, self.back_button):
+            game_layout.addWidget(widget)
+
+        # Page de menu : titre et boutons réutilisés d'un menu à l'autre (boutons ajoutés au besoin)
+        self.menu_page = QWidget()
+        self.menu_layout = QVBoxLayout(self.menu_page)
+
+        self.menu_title = QLabel()
+        self.menu_title.setStyleSheet("color: white; font-size: 20px; font-weight: bold;")
+        self.menu_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.menu_layout.addWidget(self.menu_title)
+
+        self._menu_buttons = []
+        self._menu_group = QButtonGroup(self.menu_page)
+        self._menu_group.idClicked.connect(self._resume) # L'id du bouton est l'index de l'option
+
+        self.stack.addWidget(self.menu_page)
+        self.stack.addWidget(self.game_page)
+
+        # Message superposé à la fenêtre, masqué automatiquement (remplace les boîtes de dialogue)
+        self._toast = QLabel(self.window)
+        self._toast.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._toast.setStyleSheet("background-color: rgba(0, 0, 0, 180); color: white; font-size: 22px;"
+                                  " font-weight: bold; padding: 20px; border-radius: 10px;")
+        self._toast.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+        self._toast.hide()
+        self._toast_timer = QTimer()
+        self._toast_timer.setSingleShot(True)
+        self._toast_timer.timeout.connect(self._toast.hide)
 
         self.window.show()
 
         # Mécanisme d'attente active (EventLoop)
         self.loop = QEventLoop()
         self.result = None
+
+        # Minuteur de pause réutilisé : la pause tourne dans la même boucle que _wait
+        self._pause_timer = QTimer()
+        self._pause_timer.setSingleShot(True)
+        self._pause_timer.timeout.connect(self.loop.quit)
         self._running = True
         self.app.aboutToQuit.connect(self._on_quit)
 
@@ -105,82 +285,90 @@ class Interface:
         self.result = value
         self.loop.quit()
 
-    def _clean_ui(self) -> None:
-        while self.layout.count():
-            item = self.layout.takeAt(0)
-            if item.widget(): item.widget().deleteLater()
+    def _on_cell_clicked(self, row: int, col: int) -> None:
+        """Transmet le clic au contrôleur uniquement lorsqu'un coup est attendu."""
+        if self._awaiting_move:
+            self._resume((row, col))
+
+    def _add_menu_button(self) -> None:
+        btn = QPushButton()
+        btn.setFont(QFont("Arial", 14))
+        btn.setStyleSheet("background-color: #3498db; color: white; padding: 15px; border-radius: 5px;")
+        self._menu_group.addButton(btn, len(self._menu_buttons))
+        self.menu_layout.addWidget(btn)
+        self._menu_buttons.append(btn)
+
+    def _show_game(self, with_back_button: bool) -> None:
+        """Affiche la page de jeu, avec ou sans le bouton de retour au menu."""
+        self.back_button.setVisible(with_back_button)
+        self.stack.setCurrentWidget(self.game_page)
+
+    def _set_status(self, player: int, message: str = None) -> None:
+        nom, _ = self._get_player_info(player)
+        self.status_label.setText(message if message else f"Au tour de : {nom}")
+        self.status_label.setPalette(self._status_palettes[player])
 
     def send_menu(self, title: str, options: list[str]) -> Optional[int]:
         """Affiche un menu de sélection."""
         if not self._running: return None
-        self._clean_ui()
-
-        lbl = QLabel(title)
-        lbl.setStyleSheet("color: white; font-size: 20px; font-weight: bold;")
-        lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layout.addWidget(lbl)
+        self.menu_title.setText(title)
 
-        for i, txt in enumerate(options):
-            btn = QPushButton(txt)
-            btn.setFont(QFont("Arial", 14))
-            btn.setStyleSheet("background-color: #3498db; color: white; padding: 15px; border-radius: 5px;")
-            btn.clicked.connect(lambda _, idx=i: self._resume(idx))
-            self.layout.addWidget(btn)
+        while len(self._menu_buttons) < len(options):
+            self._add_menu_button()
+        for i, btn in enumerate(self._menu_buttons):
+            if i < len(options):
+                btn.setText(options[i])
+            btn.setVisible(i < len(options))
 
+        self.stack.setCurrentWidget(self.menu_page)
         return self._wait()
 
     def send_game(self, player: int, board: np.ndarray) -> Optional[tuple[int]]:
         """Affiche le plateau de jeu et attend une action utilisateur."""
         if not self._running: return None
-        self._clean_ui()
-
-        nom, code_couleur = self._get_player_info(player)
-
-        lbl = QLabel(f"Au tour de : {nom}")
-        lbl.setStyleSheet(f"color: {code_couleur}; font-size: 24px; font-weight: bold;")
-        lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layout.addWidget(lbl)
+        self._show_game(with_back_button=True)
+        self._set_status(player)
+        self.board_widget.set_board(board)
 
-        board_widget = BoardWidget(board)
-        board_widget.cell_cliquee.connect(lambda r, c: self._resume((r, c)))
-        
-        self.layout.addWidget(board_widget)
-
-        btn = QPushButton("Retour Menu")
-        btn.setStyleSheet("background-color: #95a5a6; color: white;")
-        btn.clicked.connect(lambda: self._resume(None))
-        self.layout.addWidget(btn)
-
-        return self._wait()
+        self._awaiting_move = True
+        try:
+            return self._wait()
+        finally:
+            self._awaiting_move = False
 
     def refresh_only(self, player: int, board: np.ndarray, message: str = None) -> None:
         """Met à jour l'affichage sans attendre d'action."""
         if not self._running: return
-        self._clean_ui()
-       
-        nom, code_couleur = self._get_player_info(player)
-
-        texte = message if message else f"Au tour de : {nom}"
-
-        lbl = QLabel(texte)
-        lbl.setStyleSheet(f"color: {code_couleur}; font-size: 24px; font-weight: bold;")
-        lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layout.addWidget(lbl)
-
-        board_widget = BoardWidget(board)
-        self.layout.addWidget(board_widget)
-
-        QApplication.processEvents()
+        self._show_game(with_back_button=False)
+        self._set_status(player, message)
+        # set_board planifie seulement le rafraîchissement : Qt le regroupe avec celui du label et
+        # l'exécute à la prochaine itération de la boucle d'événements (pause, message, coup suivant)
+        self.board_widget.set_board(board)
+
+    def _show_toast(self, message: str) -> None:
+        """Affiche un message au centre de la fenêtre pendant TOAST_MS millisecondes."""
+        self._toast.setText(message)
+        self._toast.adjustSize()
+        self._toast.move((self.window.width() - self._toast.width()) // 2,
+                         (self.window.height() - self._toast.height()) // 2)
+        self._toast.raise_()
+        self._toast.show()
+        self._toast_timer.start(self.TOAST_MS)
 
     def notify_victory(self, player: int) -> None:
+        if self.silent: return
         nom = "ROUGE" if player == -1 else "JAUNE"
-        QMessageBox.information(self.window, "Victoire !", f"Le joueur {nom} a gagné !")
+        self._show_toast(f"Le joueur {nom} a gagné !")
+        self.pause(self.TOAST_MS) # Fin de partie : plateau final visible avant le retour au menu
 
     def notify_message(self, message: str)->None:
-        QMessageBox.information(self.window, "", message)
+        if self.silent: return
+        self._show_toast(message)
 
     def notify_draw(self) -> None:
-        QMessageBox.information(self.window, "Égalité", "Match nul !")
+        if self.silent: return
+        self._show_toast("Match nul !")
+        self.pause(self.TOAST_MS)
 
     def set_title(self, title: str) -> None:
         self.window.setWindowTitle(title)
@@ -188,14 +376,14 @@ class Interface:
     def pause(self, milliseconds: int) -> None:
         """Met en pause l'exécution sans figer l'interface graphique."""
         if not self._running: return
-        
-        loop = QEventLoop()
-        QTimer.singleShot(milliseconds, loop.quit)
-        loop.exec()
+
+        self._pause_timer.start(milliseconds)
+        self.loop.exec()
+        self._pause_timer.stop() # Sortie anticipée (fermeture de la fenêtre)
     
-    def _get_player_info(self, player_code: int):
-        """Retourne le nom et la couleur hexadécimale associée au joueur."""
+    def _get_player_info(self, player_code: int) -> tuple[str, QColor]:
+        """Retourne le nom et la couleur (QColor) associée au joueur."""
         if player_code == -1: 
-            return "Joueur 1 (ROUGE)", "#e74c3c"
+            return "Joueur 1 (ROUGE)", _RED
         else:                 
-            return "Joueur 2 (JAUNE)", "#f1c40f"
+            return "Joueur 2 (JAUNE)", _YEL
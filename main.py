@@ -1,10 +1,13 @@
 import sys
 import os
+import logging
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from game.controller import Controller 
 
 if __name__ == "__main__":
+    # Passer à logging.DEBUG pour suivre les coups de l'IA dans la console
+    logging.basicConfig(level=logging.WARNING)
     app_ctrl = Controller()
     app_ctrl.start()
@@ -23,6 +23,46 @@ class TestClassicGame(unittest.TestCase):
         # Le gagnant reste le current_player car le jeu s'arrête
         self.assertEqual(self.game.current_player, 1, "Le gagnant (1) devrait rester le current_player")
 
+    def test_victoire_horizontale(self):
+        """Vérifie qu'aligner 4 pions sur une ligne donne la victoire"""
+        self.game.board[5, 0:3] = 1
+
+        self.game.play((0, 3))
+
+        self.assertTrue(self.game.victory, "La victoire horizontale devrait être validée")
+
+    def test_victoire_diagonale(self):
+        """Vérifie les deux diagonales (montante vers la droite et vers la gauche)"""
+        for cols in ([0, 1, 2, 3], [6, 5, 4, 3]):
+            with self.subTest(colonnes=cols):
+                game = ClassicGame()
+                game._current_player = 1
+                # Pions rouges en escalier, soutenus par des pions jaunes
+                for hauteur, col in enumerate(cols):
+                    game.board[5 - hauteur + 1:, col] = -1
+                    if hauteur < 3:
+                        game.board[5 - hauteur, col] = 1
+
+                game.play((0, cols[3])) # Le 4ème pion tombe en haut de l'escalier
+
+                self.assertTrue(game.victory, "La victoire en diagonale devrait être validée")
+
+    def test_pas_de_victoire_a_cheval_sur_les_bords(self):
+        """Des pions consécutifs en mémoire mais pas sur la grille ne forment pas un alignement"""
+        # Fin de la ligne 4 (colonnes 4 à 6) puis début de la ligne 5 (colonne 0)
+        self.game.board[5, 4:] = -1
+        self.game.board[4, 4:] = 1
+        self.game.play((0, 0))
+        self.assertFalse(self.game.victory, "Les colonnes 6 et 0 ne sont pas voisines")
+
+        # Haut de la colonne 1 puis bas de la colonne 2
+        game = ClassicGame()
+        game._current_player = 1
+        game.board[3:, 1] = -1
+        game.board[:3, 1] = 1
+        game.play((0, 2))
+        self.assertFalse(game.victory, "Le haut d'une colonne n'est pas voisin du bas de la suivante")
+
     def test_colonne_pleine(self):
         """Vérifie qu'on ne peut pas jouer dans une colonne pleine"""
         # On remplit la colonne 0 entièrement
@@ -32,6 +72,33 @@ class TestClassicGame(unittest.TestCase):
         with self.assertRaises(InvalidMove):
             self.game.play((0, 0))
 
+    def test_egalite_grille_pleine(self):
+        """Vérifie qu'une grille remplie sans alignement donne un match nul"""
+        sequence = [0, 1, 5, 5, 0, 2, 3, 2, 0, 3, 4, 5, 3, 6, 4, 3, 5, 6, 2, 2, 2,
+                    2, 3, 0, 4, 1, 6, 1, 0, 4, 5, 0, 1, 1, 1, 4, 4, 3, 5, 6, 6, 6]
+        for col in sequence:
+            self.assertFalse(self.game.draw, "Pas d'égalité avant le dernier pion")
+            self.game.play((0, col))
+
+        self.assertTrue(self.game.draw, "La grille pleine devrait donner un match nul")
+        self.assertFalse(self.game.victory)
+
+
+    def test_egalite_position_preparee(self):
+        """Une grille remplie directement (sans jouer les coups) donne aussi un match nul"""
+        sequence = [0, 1, 5, 5, 0, 2, 3, 2, 0, 3, 4, 5, 3, 6, 4, 3, 5, 6, 2, 2, 2,
+                    2, 3, 0, 4, 1, 6, 1, 0, 4, 5, 0, 1, 1, 1, 4, 4, 3, 5, 6, 6, 6]
+        partie = ClassicGame()
+        partie._current_player = 1
+        for col in sequence[:-1]:
+            partie.play((0, col))
+
+        self.game.board[:] = partie.board # Grille à un pion de la fin
+        self.game._current_player = partie.current_player
+        self.game.play((0, sequence[-1]))
+
+        self.assertTrue(self.game.draw, "Le compteur de pions doit suivre le plateau")
+
 
 class TestVariante1(unittest.TestCase):
     
@@ -98,5 +165,57 @@ class TestVariante1(unittest.TestCase):
         with self.assertRaises(InvalidMove):
             self.game.play((5, 0)) # Essaie de retirer son propre pion
 
+    def test_retrait_victoire_du_joueur(self):
+        """La chute après un retrait peut compléter un alignement du joueur qui retire"""
+        self.game._event = True
+        self.game.board[5, 0:3] = 1
+        self.game.board[5, 3] = -1 # Pion retiré
+        self.game.board[4, 3] = 1  # Tombe en (5, 3) et complète la ligne
+
+        self.game.play((5, 3))
+
+        self.assertTrue(self.game.victory)
+        self.assertFalse(self.game.draw)
+        self.assertEqual(self.game.current_player, 1, "Le joueur qui a retiré le pion gagne")
+
+    def test_retrait_victoire_de_l_adversaire(self):
+        """Si la chute aligne 4 pions adverses, c'est l'adversaire qui gagne"""
+        self.game._event = True
+        self.game.board[5, 0:3] = [1, -1, 1]
+        self.game.board[4, 0:3] = -1
+        self.game.board[3:, 3] = [-1, 1, -1] # Retrait de (5, 3) : le -1 de (3, 3) descend en (4, 3)
+
+        self.game.play((5, 3))
+
+        self.assertTrue(self.game.victory)
+        self.assertFalse(self.game.draw)
+        self.assertEqual(self.game.current_player, -1, "La victoire revient à l'adversaire")
+
+    def test_retrait_double_victoire_egalite(self):
+        """Si la chute complète un alignement pour chacun des deux joueurs, la partie est nulle"""
+        self.game._event = True
+        self.game.board[5, 0:3] = 1
+        self.game.board[4, 0:3] = -1
+        self.game.board[3:, 3] = [-1, 1, -1]
+
+        self.game.play((5, 3))
+
+        self.assertTrue(self.game.draw)
+        self.assertFalse(self.game.victory)
+        self.assertFalse(self.game.event)
+
+    def test_choix_victime_ia(self):
+        """L'IA vise en priorité les colonnes centrales, en partant du bas"""
+        self.assertIsNone(self.game.get_best_victim(-1), "Aucun pion adverse sur le plateau")
+
+        self.game.board[5, 0] = -1
+        self.game.board[5, 2] = 1
+        self.game.board[4, 2] = -1
+        self.game.board[3, 2] = -1
+        self.assertEqual(self.game.get_best_victim(-1), (4, 2))
+
+        self.game.board[5, 3] = -1
+        self.assertEqual(self.game.get_best_victim(-1), (5, 3))
+
 if __name__ == '__main__':
     unittest.main()
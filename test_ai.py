@@ -1,3 +1,4 @@
+import unittest
 import numpy as np
 from game.calculateur import AIModel
 
@@ -30,5 +31,94 @@ def test():
     else:
         print("ECHEC : L'IA n'a pas joué le coup optimal.")
 
+
+def _plateaux_aleatoires(n, nb_pions, seed=0):
+    """Génère n plateaux valides (gravité respectée) de nb_pions pions chacun."""
+    rng = np.random.default_rng(seed)
+    plateaux = np.zeros((n, 6, 7), dtype=np.int32)
+    for plateau in plateaux:
+        hauteurs = [0] * 7
+        joueur = -1
+        for _ in range(nb_pions):
+            col = int(rng.choice([c for c in range(7) if hauteurs[c] < 6]))
+            plateau[5 - hauteurs[col], col] = joueur
+            hauteurs[col] += 1
+            joueur = -joueur
+    return plateaux
+
+def _charger_ia():
+    """Renvoie le moteur C++, ou signale le test comme ignoré s'il n'est pas compilé."""
+    try:
+        return AIModel()
+    except Exception as e:
+        raise unittest.SkipTest(f"Moteur C++ indisponible : {e}")
+
+def test_lot_identique_aux_appels_unitaires():
+    """get_best_moves renvoie, pour chaque plateau du lot, le coup de get_best_move."""
+    ai = _charger_ia()
+
+    plateaux = _plateaux_aleatoires(30, 6, seed=1)
+    copie = plateaux.copy()
+    coups = ai.get_best_moves(plateaux, depth=4)
+
+    assert coups.shape == (30,)
+    assert list(coups) == [ai.get_best_move(p, depth=4) for p in plateaux]
+    assert (plateaux == copie).all(), "Les plateaux ne doivent pas être modifiés"
+
+def test_lot_formats_entree():
+    """Le lot accepte des plateaux (n, 6, 7) ou aplatis (n, 42), en int8 comme en int32."""
+    ai = _charger_ia()
+
+    plateaux = _plateaux_aleatoires(10, 8, seed=2)
+    attendu = list(ai.get_best_moves(plateaux, depth=3))
+
+    assert list(ai.get_best_moves(plateaux.reshape(10, 42), depth=3)) == attendu
+    assert list(ai.get_best_moves(plateaux.astype(np.int8), depth=3)) == attendu # dtype du Gestionnaire
+    assert list(ai.get_best_moves(list(plateaux), depth=3)) == attendu
+
+def test_lot_forme_invalide():
+    """Un lot de mauvaise forme est refusé, même si son nombre de cases est un multiple de 42."""
+    ai = _charger_ia()
+
+    for forme in [(7, 6, 6), (3, 7, 6), (6, 14)]:
+        try:
+            ai.get_best_moves(np.zeros(forme, dtype=np.int8))
+        except ValueError:
+            continue
+        raise AssertionError(f"La forme {forme} aurait dû être refusée")
+
+def test_lot_vide():
+    """Un lot vide renvoie un tableau de coups vide."""
+    ai = _charger_ia()
+
+    coups = ai.get_best_moves(np.empty((0, 6, 7), dtype=np.int8))
+    assert coups.shape == (0,)
+
+def test_recherche_independante_de_l_historique():
+    """Une recherche peu profonde donne le même coup avant et après une recherche profonde."""
+    ai = _charger_ia()
+
+    plateaux = _plateaux_aleatoires(20, 4)
+    avant = [ai.get_best_move(p, depth=2) for p in plateaux]
+    lot_avant = list(ai.get_best_moves(plateaux, depth=2))
+    ai.get_best_moves(plateaux, depth=5) # Remplit la table de transposition à plus grande profondeur
+
+    assert [ai.get_best_move(p, depth=2) for p in plateaux] == avant, \
+        "Le coup choisi ne doit pas dépendre des recherches précédentes"
+    assert list(ai.get_best_moves(plateaux, depth=2)) == lot_avant
+
+def test_prechauffage_sans_effet_sur_le_coup():
+    """warm_search suivi de get_best_move renvoie le même coup qu'une recherche à froid."""
+    ai = _charger_ia()
+
+    plateaux = _plateaux_aleatoires(20, 6, seed=3)
+    for depth, mode in [(2, 0), (4, 1), (6, 0)]:
+        a_froid = [ai.get_best_move(p, depth, mode) for p in plateaux]
+        prechauffes = []
+        for p in plateaux:
+            ai.warm_search(p, depth, mode) # Comme le contrôleur pendant la pause de l'interface
+            prechauffes.append(ai.get_best_move(p, depth, mode))
+        assert prechauffes == a_froid, f"Le préchauffage change le coup (profondeur {depth})"
+
 if __name__ == "__main__":
     test()
\ No newline at end of file